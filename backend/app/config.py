@@ -1,5 +1,7 @@
 """Configuration helpers for Ask My Race backend services."""
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -31,6 +33,7 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return a new Settings instance; relies on pydantic caching."""
+    """Return the process-wide Settings instance, reading the environment once."""
     return Settings()
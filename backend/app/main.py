@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import re
 import time
 import uuid
-from collections import defaultdict, deque
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Deque, Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 from fastapi import FastAPI, File, HTTPException, Request, UploadFile
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.app.config import get_settings
 from backend.app.schemas import (
@@ -23,15 +31,17 @@ from backend.app.schemas import (
     UploadResponse,
 )
 from backend.app.services import document_registry
-from backend.app.services.document_registry import Chunk, DocumentEntry
-from backend.app.services.embedding import embed_chunks, embed_query
-from backend.app.services.pdf_loader import PageChunk, load_pdf_chunks
+from backend.app.services.document_registry import Chunk, DocumentEntry, ScheduleDay
+from backend.app.services.embedding import EMBED_BATCH_SIZE, EMBED_MAX_CONCURRENCY, aembed_chunks, embed_query
+from backend.app.services.pdf_loader import PageChunk, PdfSource, iter_pdf_chunks, open_pdf
 from backend.app.services.schedule_extractor import extract_schedule
 from backend.app.services.qa import answer_question
 
 load_dotenv(override=True)
 
-app = FastAPI(title="Ask My Race API", version="0.1.0")
+PreparedPdf = Tuple[List[PageChunk], int, List[np.ndarray], List[ScheduleDay]]
+
+app = FastAPI(title="Ask My Race API", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -44,12 +54,20 @@ app.add_middleware(
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 EXAMPLES_DIR = BASE_DIR / "race_examples"
 MAX_PDF_SIZE_BYTES = 80 * 1024 * 1024  # 80 MB limit
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # boundaries and part headers around the file
+EXAMPLE_CACHE_SIZE = 8
+ANSWER_CACHE_SIZE = 512
+SLUG_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+FILENAME_SEPARATOR_PATTERN = re.compile(r"[_-]+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
 BANNED_PATTERNS = [
     re.compile(r"ignore\s+(?:all|any)\s+previous\s+instructions", re.IGNORECASE),
     re.compile(r"pretend\s+to\s+be", re.IGNORECASE),
     re.compile(r"leak\s+.*prompt", re.IGNORECASE),
     re.compile(r"reveal\s+.*system", re.IGNORECASE),
 ]
+# Hot-path patterns below are lowercase-only and run against pre-lowered text.
+BANNED_PATTERN = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in BANNED_PATTERNS))
 TRIATHLON_KEYWORDS = [
     "triathlon",
     "triathlete",
@@ -69,60 +87,135 @@ TRIATHLON_KEYWORDS = [
     "relay",
 ]
 MIN_KEYWORD_MATCHES = 3
+TRIATHLON_SAMPLE_CHUNKS = 10
 RACK_TIME_PATTERN = re.compile(r"\b\d{1,2}:\d{2}\b")
 TIME_RANGE_PATTERN = re.compile(r"\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}")
-DAY_PATTERN = re.compile(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+[A-Za-z]+", re.IGNORECASE)
+DAY_PATTERN = re.compile(r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+[a-z]+")
+TRANSITION_1_KEYWORDS = (
+    "transition 1",
+    "transition one",
+    "t1",
+    "rack",
+    "bike bag",
+    "blue bag",
+    "bike check",
+)
+TRANSITION_2_KEYWORDS = (
+    "transition 2",
+    "transition two",
+    "t2",
+    "red bag",
+    "run bag",
+    "run gear",
+    "run equipment",
+)
+TRANSITION_QUESTION_PATTERNS = {
+    "1": re.compile("|".join(map(re.escape, TRANSITION_1_KEYWORDS))),
+    "2": re.compile("|".join(map(re.escape, TRANSITION_2_KEYWORDS))),
+}
+SCHEDULE_QUESTION_KEYWORDS = (
+    "when",
+    "time",
+    "schedule",
+    "timetable",
+    "open",
+    "close",
+    "start",
+    "finish",
+    "cut-off",
+    "cutoff",
+    "deadline",
+    "check-in",
+    "check in",
+    "registration",
+    "register",
+    "briefing",
+    "collect",
+    "pick up",
+    "pickup",
+    "wave",
+    "morning",
+    "day",
+    "date",
+    "until",
+    "before",
+    "after",
+    "late",
+    "early",
+    "hour",
+)
+SCHEDULE_QUESTION_PATTERN = re.compile("|".join(map(re.escape, SCHEDULE_QUESTION_KEYWORDS)))
+TRANSITION_MENTION_PATTERNS = {
+    "1": re.compile(r"transition 1"),
+    "2": re.compile(r"transition 2"),
+}
+TRANSITION_WINDOW_CHARS = 800
 TRANSITION_LINE_PATTERN = re.compile(
-    r"(Transition\s+(?P<num>[12])[^,\n]*?)(?:,\s*)?(?:(?P<day_phrase>(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+[A-Za-z]+))?(?:[^0-9]{0,80})?(?P<time_range>\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2})",
-    re.IGNORECASE,
+    r"(transition\s+(?P<num>[12])[^,\n]*?)(?:,\s*)?(?:(?P<day_phrase>(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+\d{1,2}(?:st|nd|rd|th)?\s+[a-z]+))?(?:[^0-9]{0,80})?(?P<time_range>\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2})",
 )
 
 
 class RateLimiter:
-    """Fixed-window limiter keyed by client IP or forwarded address."""
+    """Token-bucket limiter keyed by client IP or forwarded address."""
+    MAX_TRACKED_KEYS = 10_000
+
     def __init__(self, limit: int, window_seconds: int) -> None:
-        """Initialize the limiter with a quota and window size in seconds."""
+        """Initialize the limiter with a burst quota refilled over a window in seconds."""
         self.limit = limit
         self.window = window_seconds
-        self._records: Dict[str, Deque[float]] = defaultdict(deque)
+        self._refill_rate = limit / window_seconds
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
 
     def check(self, key: str) -> bool:
-        """Return True if another request is allowed and record its timestamp."""
+        """Return True if another request is allowed and spend one token for it."""
         now = time.monotonic()
-        window_start = now - self.window
-        queue = self._records[key]
-        while queue and queue[0] < window_start:
-            queue.popleft()
-        if len(queue) >= self.limit:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(self.limit)
+            if len(self._buckets) >= self.MAX_TRACKED_KEYS:
+                self._buckets.popitem(last=False)
+        else:
+            stored, last = bucket
+            tokens = min(float(self.limit), stored + (now - last) * self._refill_rate)
+            self._buckets.move_to_end(key)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
             return False
-        queue.append(now)
+        self._buckets[key] = (tokens - 1, now)
         return True
 
 
+# Demo guides are deterministic, so their parsed chunks, embeddings, and schedule are reused.
+_prepared_examples: OrderedDict[Tuple[str, int], PreparedPdf] = OrderedDict()
+# Repeat questions against the same guide skip the embedding and chat round trips.
+_answer_cache: OrderedDict[Tuple[str, str, str], AskResponse] = OrderedDict()
+
 upload_rate_limiter = RateLimiter(limit=5, window_seconds=60)
 ask_rate_limiter = RateLimiter(limit=30, window_seconds=60)
 
 
-def ingest_pdf(file_bytes: bytes, filename: str) -> UploadResponse:
+async def ingest_pdf(source: PdfSource, filename: str) -> UploadResponse:
     """Parse the PDF, embed its chunks, and register the document for later retrieval."""
-    chunks, page_count = load_pdf_chunks(file_bytes)
-    if not chunks:
-        raise ValueError("Could not extract text from the PDF.")
+    return _register_document(filename, await _prepare_pdf(source))
 
-    if not _looks_like_triathlon_guide(chunks):
-        raise ValueError(
-            "The uploaded PDF does not appear to describe a triathlon athlete guide."
-        )
 
-    schedule_sections = extract_schedule(file_bytes, chunks)
-    embeddings = embed_chunks([chunk.text for chunk in chunks])
+async def _prepare_pdf(source: PdfSource) -> PreparedPdf:
+    """Run the parse, embed, and schedule extraction steps that depend only on the PDF."""
+    chunks, page_count, embeddings = await _load_and_embed_chunks(source)
+    schedule_sections = await run_in_threadpool(extract_schedule, source, chunks)
+    return chunks, page_count, embeddings, schedule_sections
+
+
+def _register_document(filename: str, prepared: PreparedPdf) -> UploadResponse:
+    """Build a fresh DocumentEntry from prepared PDF data and add it to the registry."""
+    chunks, page_count, embeddings, schedule_sections = prepared
     registry = document_registry.get_registry()
     document_id = str(uuid.uuid4())
     entry = DocumentEntry(
         id=document_id,
         filename=filename,
         page_count=page_count,
-        uploaded_at=datetime.utcnow(),
+        uploaded_at=datetime.now(timezone.utc),
         schedule=schedule_sections,
     )
     for chunk, vector in zip(chunks, embeddings, strict=False):
@@ -136,6 +229,9 @@ def ingest_pdf(file_bytes: bytes, filename: str) -> UploadResponse:
                 embedding=vector,
             )
         )
+    entry.build_embedding_matrix()
+    _index_schedule_chunks(entry)
+    entry.transition_notes = _build_transition_notes(entry)
     registry.add(entry)
 
     schedule_payload = [
@@ -158,134 +254,217 @@ def ingest_pdf(file_bytes: bytes, filename: str) -> UploadResponse:
     )
 
 
+async def _load_and_embed_chunks(source: PdfSource) -> Tuple[List[PageChunk], int, List[np.ndarray]]:
+    """Parse pages in a worker thread and embed chunk batches as soon as they fill up."""
+    reader = await run_in_threadpool(open_pdf, source)
+    page_count = len(reader.pages)
+    semaphore = asyncio.Semaphore(EMBED_MAX_CONCURRENCY)
+    chunks: List[PageChunk] = []
+    embed_tasks: List[asyncio.Task[List[np.ndarray]]] = []
+    dispatched = 0
+    validated = False
+
+    def _dispatch(end: int) -> None:
+        nonlocal dispatched
+        texts = [chunk.text for chunk in chunks[dispatched:end]]
+        embed_tasks.append(asyncio.create_task(aembed_chunks(texts, semaphore=semaphore)))
+        dispatched = end
+
+    try:
+        async for chunk in iterate_in_threadpool(iter_pdf_chunks(reader)):
+            chunks.append(chunk)
+            if not validated:
+                if len(chunks) < TRIATHLON_SAMPLE_CHUNKS:
+                    continue
+                _ensure_triathlon_guide(chunks)
+                validated = True
+            if len(chunks) - dispatched >= EMBED_BATCH_SIZE:
+                _dispatch(len(chunks))
+        if not chunks:
+            raise ValueError("Could not extract text from the PDF.")
+        if not validated:
+            _ensure_triathlon_guide(chunks)
+        if dispatched < len(chunks):
+            _dispatch(len(chunks))
+        batches = await asyncio.gather(*embed_tasks)
+    except BaseException:
+        for task in embed_tasks:
+            task.cancel()
+        raise
+    embeddings = [vector for batch in batches for vector in batch]
+    return chunks, page_count, embeddings
+
+
+def _ensure_triathlon_guide(chunks: Sequence[PageChunk]) -> None:
+    """Raise when the leading chunks do not read like a triathlon athlete guide."""
+    if not _looks_like_triathlon_guide(chunks):
+        raise ValueError(
+            "The uploaded PDF does not appear to describe a triathlon athlete guide."
+        )
+
+
 def list_example_guides() -> List[ExampleGuide]:
     """Return a list of built-in demo guides discovered under race_examples/."""
-    if not EXAMPLES_DIR.exists():
-        return []
+    guides, _ = _example_guides()
+    return list(guides)
+
+
+def _example_guides() -> Tuple[Tuple[ExampleGuide, ...], Dict[str, ExampleGuide]]:
+    """Return the cached demo guide scan, refreshed whenever the directory changes."""
+    try:
+        mtime_ns = EXAMPLES_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return (), {}
+    return _scan_example_guides(mtime_ns)
 
+
+@lru_cache(maxsize=4)
+def _scan_example_guides(mtime_ns: int) -> Tuple[Tuple[ExampleGuide, ...], Dict[str, ExampleGuide]]:
+    """Glob the examples directory once per directory mtime and index the guides by slug."""
     guides: List[ExampleGuide] = []
+    by_slug: Dict[str, ExampleGuide] = {}
     for path in sorted(EXAMPLES_DIR.glob("*.pdf")):
         filename = path.name
         stem = path.stem
         slug = _slugify(stem)
         name = _humanize(stem)
-        guides.append(ExampleGuide(slug=slug, name=name, filename=filename))
-    return guides
+        guide = ExampleGuide(slug=slug, name=name, filename=filename)
+        guides.append(guide)
+        by_slug.setdefault(slug, guide)
+    return tuple(guides), by_slug
+
+
+def _find_example_guide(slug: str) -> ExampleGuide | None:
+    """Look up a demo guide by slug using the cached directory scan."""
+    _, by_slug = _example_guides()
+    return by_slug.get(slug)
+
+
+async def _prepare_example(filename: str) -> PreparedPdf:
+    """Return parsed and embedded demo guide data, recomputing only when the file changes."""
+    file_path = EXAMPLES_DIR / filename
+    key = (filename, file_path.stat().st_mtime_ns)
+    prepared = _prepared_examples.get(key)
+    if prepared is not None:
+        _prepared_examples.move_to_end(key)
+        return prepared
+    file_bytes = await run_in_threadpool(file_path.read_bytes)
+    prepared = await _prepare_pdf(file_bytes)
+    _prepared_examples[key] = prepared
+    while len(_prepared_examples) > EXAMPLE_CACHE_SIZE:
+        _prepared_examples.popitem(last=False)
+    return prepared
 
 
 def _looks_like_triathlon_guide(chunks: Iterable[PageChunk]) -> bool:
     """Heuristically validate that the uploaded PDF references triathlon terminology."""
-    pages = list(chunks)
-    sample_text = " ".join(chunk.text for chunk in pages[:10])
-    lower_text = sample_text.lower()
-    matches = sum(1 for keyword in TRIATHLON_KEYWORDS if keyword in lower_text)
-    return matches >= MIN_KEYWORD_MATCHES
+    sample_text = " ".join(chunk.text for chunk in islice(chunks, TRIATHLON_SAMPLE_CHUNKS)).lower()
+    matches = 0
+    for keyword in TRIATHLON_KEYWORDS:
+        if keyword in sample_text:
+            matches += 1
+            if matches >= MIN_KEYWORD_MATCHES:
+                return True
+    return False
 
 
 def _slugify(value: str) -> str:
     """Generate a filesystem-safe slug from a filename stem."""
-    cleaned = re.sub(r"[^a-z0-9]+", "-", value.lower())
+    cleaned = SLUG_SEPARATOR_PATTERN.sub("-", value.lower())
     return cleaned.strip("-") or value.lower()
 
 
 def _humanize(value: str) -> str:
     """Turn a filename stem into a readable title for display purposes."""
-    cleaned = re.sub(r"[_-]+", " ", value)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = FILENAME_SEPARATOR_PATTERN.sub(" ", value)
+    cleaned = WHITESPACE_PATTERN.sub(" ", cleaned).strip()
     return cleaned.title()
 
 
 
-def _needs_transition(question: str, transition: str) -> bool:
-    """Check whether the user question references the given transition."""
+def _requested_transitions(question: str) -> Tuple[str, ...]:
+    """Return the transitions ("1", "2") that the user question references."""
     lower = question.lower()
-    if transition == "1":
-        keywords = (
-            "transition 1",
-            "transition one",
-            "t1",
-            "rack",
-            "bike bag",
-            "blue bag",
-            "bike check",
-        )
-    else:
-        keywords = (
-            "transition 2",
-            "transition two",
-            "t2",
-            "red bag",
-            "run bag",
-            "run gear",
-            "run equipment",
-        )
-    return any(keyword in lower for keyword in keywords)
+    return tuple(
+        transition
+        for transition, pattern in TRANSITION_QUESTION_PATTERNS.items()
+        if pattern.search(lower) is not None
+    )
+
+
+def _wants_schedule(question: str, context: str | None, transitions: Sequence[str]) -> bool:
+    """Return True when the question is timing-related, so the full schedule is worth its prompt tokens."""
+    if transitions:
+        return True
+    text = f"{question}\n{context}" if context else question
+    return SCHEDULE_QUESTION_PATTERN.search(text.lower()) is not None
 
 
-def _has_transition_schedule(text: str, transition: str) -> bool:
+def _has_transition_schedule(chunk: Chunk, transition: str) -> bool:
     """Return True when the chunk text appears to contain schedule info for a transition."""
-    lower = text.lower()
-    if f"transition {transition}" not in lower:
+    if f"transition {transition}" not in chunk.lower_text:
         return False
-    if not RACK_TIME_PATTERN.search(text):
-        return False
-    if transition == "1":
-        keywords = ("transition 1", "bike", "blue bag", "rack")
-    else:
-        keywords = ("transition 2", "red bag", "run bag", "transition two")
-    return any(keyword in lower for keyword in keywords)
+    return RACK_TIME_PATTERN.search(chunk.text) is not None
+
+
+def _index_schedule_chunks(entry: DocumentEntry) -> None:
+    """Flag chunks carrying transition schedule info so /ask can skip rescanning them."""
+    for chunk in entry.chunks:
+        transitions = frozenset(
+            transition for transition in ("1", "2") if _has_transition_schedule(chunk, transition)
+        )
+        chunk.schedule_transitions = transitions
+        for transition in transitions:
+            entry.schedule_chunks.setdefault(transition, []).append(chunk)
 
 
-def _augment_with_schedule_chunks(entry: DocumentEntry, selected: List[Chunk], question: str) -> List[Chunk]:
+def _augment_with_schedule_chunks(
+    entry: DocumentEntry,
+    selected: List[Chunk],
+    transitions: Sequence[str],
+) -> List[Chunk]:
     """Ensure schedule-focused answers include nearby transition chunks if missing."""
-    question_lower = question.lower()
-    needs_t1 = _needs_transition(question_lower, "1")
-    needs_t2 = _needs_transition(question_lower, "2")
-    if needs_t1 and not any(_has_transition_schedule(chunk.text, "1") for chunk in selected):
-        for chunk in entry.chunks:
-            if chunk.id in {c.id for c in selected}:
-                continue
-            if _has_transition_schedule(chunk.text, "1"):
-                selected.insert(0, chunk)
-                break
-    if needs_t2 and not any(_has_transition_schedule(chunk.text, "2") for chunk in selected):
-        for chunk in entry.chunks:
-            if chunk.id in {c.id for c in selected}:
-                continue
-            if _has_transition_schedule(chunk.text, "2"):
-                selected.append(chunk)
-                break
+    for transition in transitions:
+        candidates = entry.schedule_chunks.get(transition)
+        if not candidates:
+            continue
+        if any(transition in chunk.schedule_transitions for chunk in selected):
+            continue
+        if transition == "1":
+            selected.insert(0, candidates[0])
+        else:
+            selected.append(candidates[0])
     return selected
 
 
-def _extract_transition_schedule_notes(entry: DocumentEntry, question: str, selected: List[Chunk]) -> List[str]:
-    """Derive helper notes summarizing transition windows for the LLM prompt."""
-    question_lower = question.lower()
+def _extract_transition_schedule_notes(entry: DocumentEntry, transitions: Sequence[str]) -> List[str]:
+    """Return the precomputed transition window notes for the requested transitions."""
     notes: list[str] = []
-    if _needs_transition(question_lower, "1"):
-        notes.extend(_build_transition_notes(entry, "1"))
-    if _needs_transition(question_lower, "2"):
-        notes.extend(_build_transition_notes(entry, "2"))
+    for transition in transitions:
+        notes.extend(entry.transition_notes.get(transition, []))
     return notes
 
 
-def _build_transition_notes(entry: DocumentEntry, transition: str) -> List[str]:
-    """Collect the most relevant schedule mentions for a specific transition."""
-    collected: list[tuple[str | None, str]] = []
-    seen: set[tuple[str | None, str]] = set()
+def _build_transition_notes(entry: DocumentEntry) -> Dict[str, List[str]]:
+    """Collect the most relevant schedule mentions for both transitions in one pass."""
+    collected: Dict[str, list[tuple[str | None, str]]] = {"1": [], "2": []}
+    seen: Dict[str, set[tuple[str | None, str]]] = {"1": set(), "2": set()}
     for chunk in entry.chunks:
-        if f"transition {transition}" not in chunk.text.lower():
+        mentioned = tuple(
+            transition for transition in ("1", "2") if f"transition {transition}" in chunk.lower_text
+        )
+        if not mentioned:
             continue
-        for item in _extract_transition_notes_from_text(chunk.text, transition):
-            key = (item[0], item[1])
-            if key not in seen:
-                seen.add(key)
-                collected.append(item)
-    if not collected:
-        return []
-    if transition == "1":
-        return _select_transition1_notes(collected)
-    return _select_transition2_notes(collected)
+        extracted = _extract_transition_notes(chunk.text, mentioned, chunk.lower_text)
+        for transition, items in extracted.items():
+            for item in items:
+                if item not in seen[transition]:
+                    seen[transition].add(item)
+                    collected[transition].append(item)
+    return {
+        "1": _select_transition1_notes(collected["1"]) if collected["1"] else [],
+        "2": _select_transition2_notes(collected["2"]) if collected["2"] else [],
+    }
 
 
 def _select_transition1_notes(entries: List[tuple[str | None, str]]) -> List[str]:
@@ -332,31 +511,54 @@ def _is_race_morning_time(time_range: str) -> bool:
     return start_hour <= 6
 
 
-def _extract_transition_notes_from_text(text: str, transition: str) -> List[tuple[str | None, str]]:
+def _extract_transition_notes_from_text(
+    text: str,
+    transition: str,
+    lower_text: str | None = None,
+) -> List[tuple[str | None, str]]:
     """Parse raw text for day labels and time ranges that mention a transition."""
-    results: list[tuple[str | None, str]] = []
-    for match in TRANSITION_LINE_PATTERN.finditer(text):
-        if match.group("num") == transition:
-            day_phrase = match.group("day_phrase")
-            time_range = match.group("time_range")
-            results.append((day_phrase.strip() if day_phrase else None, time_range))
-    if results:
+    return _extract_transition_notes(text, (transition,), lower_text)[transition]
+
+
+def _extract_transition_notes(
+    text: str,
+    transitions: Sequence[str],
+    lower_text: str | None = None,
+) -> Dict[str, List[tuple[str | None, str]]]:
+    """Parse day labels and time ranges for several transitions with shared regex scans."""
+    lowered = text.lower() if lower_text is None else lower_text
+    # Match on the lowered copy but slice labels from the original when offsets line up.
+    source = text if len(text) == len(lowered) else lowered
+    results: Dict[str, List[tuple[str | None, str]]] = {transition: [] for transition in transitions}
+    for match in TRANSITION_LINE_PATTERN.finditer(lowered):
+        bucket = results.get(match.group("num"))
+        if bucket is None:
+            continue
+        day_start, day_end = match.span("day_phrase")
+        time_start, time_end = match.span("time_range")
+        day_phrase = source[day_start:day_end].strip() if day_start != -1 else None
+        bucket.append((day_phrase, source[time_start:time_end]))
+    fallback = [transition for transition in transitions if not results[transition]]
+    if not fallback:
         return results
-    day_matches = [(match.group().strip(), match.start()) for match in DAY_PATTERN.finditer(text)]
-    lowered = text.lower()
-    target = f"transition {transition}"
-    for match in re.finditer(target, lowered):
-        idx = match.start()
-        nearest_day: str | None = None
-        for day_label, pos in day_matches:
-            if pos <= idx:
-                nearest_day = day_label
-            else:
-                break
-        segment = text[idx:idx + 800]
-        time_ranges = TIME_RANGE_PATTERN.findall(segment)
-        for time_range in time_ranges:
-            results.append((nearest_day, time_range))
+    day_matches = list(DAY_PATTERN.finditer(lowered))
+    day_starts = [match.start() for match in day_matches]
+    range_matches = list(TIME_RANGE_PATTERN.finditer(lowered))
+    range_starts = [match.start() for match in range_matches]
+    for transition in fallback:
+        bucket = results[transition]
+        for match in TRANSITION_MENTION_PATTERNS[transition].finditer(lowered):
+            idx = match.start()
+            day_index = bisect_right(day_starts, idx)
+            nearest_day = None
+            if day_index:
+                day_match = day_matches[day_index - 1]
+                nearest_day = source[day_match.start():day_match.end()].strip()
+            window_end = idx + TRANSITION_WINDOW_CHARS
+            for range_match in range_matches[bisect_left(range_starts, idx):]:
+                if range_match.end() > window_end:
+                    break
+                bucket.append((nearest_day, range_match.group()))
     return results
 
 
@@ -372,20 +574,15 @@ def _require_rate_limit(limiter: RateLimiter, request: Request, error_message: s
 
 def _check_text_for_abuse(text: str) -> None:
     """Reject user input containing phrases that attempt to override safety rules."""
-    for pattern in BANNED_PATTERNS:
-        if pattern.search(text):
-            raise HTTPException(
-                status_code=400,
-                detail="That request was blocked because it attempts to override safety instructions.",
-            )
-
+    if BANNED_PATTERN.search(text.lower()):
+        raise HTTPException(
+            status_code=400,
+            detail="That request was blocked because it attempts to override safety instructions.",
+        )
 
-def _ensure_pdf_size(file: UploadFile, file_bytes: bytes) -> None:
-    """Validate basic upload constraints such as size, presence, and PDF extension."""
-    size = len(file_bytes)
-    if size > MAX_PDF_SIZE_BYTES:
-        raise HTTPException(status_code=400, detail="PDF exceeds 80 MB limit.")
 
+def _ensure_pdf_filename(file: UploadFile) -> None:
+    """Validate basic upload constraints such as filename presence and PDF extension."""
     filename = file.filename
     if not isinstance(filename, str) or not filename.strip():
         raise HTTPException(status_code=400, detail="Filename is required.")
@@ -394,16 +591,29 @@ def _ensure_pdf_size(file: UploadFile, file_bytes: bytes) -> None:
         raise HTTPException(status_code=400, detail="Filename must end with .pdf")
 
 
+def _ensure_pdf_size(request: Request, file: UploadFile) -> None:
+    """Reject uploads above the size limit without reading the spooled file into memory."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > MAX_PDF_SIZE_BYTES + MULTIPART_OVERHEAD_BYTES:
+            raise HTTPException(status_code=400, detail="PDF exceeds 80 MB limit.")
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, io.SEEK_END)
+    if size > MAX_PDF_SIZE_BYTES:
+        raise HTTPException(status_code=400, detail="PDF exceeds 80 MB limit.")
+
+
 @app.post("/upload", response_model=UploadResponse)
 async def upload_pdf(request: Request, file: UploadFile = File(...)) -> UploadResponse:
     """Handle PDF uploads, rejecting invalid files and returning the ingested document info."""
     _require_rate_limit(upload_rate_limiter, request, "Too many uploads from this IP. Try again later.")
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Only PDF uploads are supported.")
-    file_bytes = await file.read()
-    _ensure_pdf_size(file, file_bytes)
+    _ensure_pdf_filename(file)
+    _ensure_pdf_size(request, file)
     try:
-        return ingest_pdf(file_bytes, file.filename)
+        return await ingest_pdf(file.file, file.filename)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -417,15 +627,13 @@ async def get_examples() -> List[ExampleGuide]:
 @app.post("/examples/{slug}", response_model=UploadResponse)
 async def load_example(slug: str) -> UploadResponse:
     """Load a demo guide by slug and ingest it as if it were freshly uploaded."""
-    for guide in list_example_guides():
-        if guide.slug == slug:
-            file_path = EXAMPLES_DIR / guide.filename
-            file_bytes = file_path.read_bytes()
-            try:
-                return ingest_pdf(file_bytes, guide.filename)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
-    raise HTTPException(status_code=404, detail="Example guide not found.")
+    guide = _find_example_guide(slug)
+    if guide is None:
+        raise HTTPException(status_code=404, detail="Example guide not found.")
+    try:
+        return _register_document(guide.filename, await _prepare_example(guide.filename))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @app.post("/ask", response_model=AskResponse)
@@ -442,42 +650,46 @@ async def ask_question(request: Request, payload: AskRequest) -> AskResponse:
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
+    cache_key = (entry.id, payload.question.casefold(), payload.context or "")
+    cached = _answer_cache.get(cache_key)
+    if cached is not None:
+        _answer_cache.move_to_end(cache_key)
+        return cached
+
     combined_query = payload.question
     if payload.context:
         combined_query = (
             f"{payload.question}\n\nPrevious conversation context:\n{payload.context}"
         )
 
-    query_embedding = embed_query(combined_query)
+    query_embedding = await run_in_threadpool(embed_query, combined_query)
     settings = get_settings()
     top_chunks = entry.similarity_search(query_embedding, top_k=settings.top_k)
-    top_chunks = _augment_with_schedule_chunks(entry, top_chunks, payload.question)
-    helper_notes = _extract_transition_schedule_notes(entry, payload.question, top_chunks)
+    transitions = _requested_transitions(payload.question)
+    top_chunks = _augment_with_schedule_chunks(entry, top_chunks, transitions)
+    helper_notes = _extract_transition_schedule_notes(entry, transitions)
     helper_text = " | ".join(helper_notes) if helper_notes else None
-    answer = answer_question(
+    answer = await run_in_threadpool(
+        answer_question,
         payload.question,
         payload.context,
         helper_text,
         top_chunks,
-        entry.schedule,
+        entry.schedule if _wants_schedule(payload.question, payload.context, transitions) else None,
     )
     citations = [
         Citation(
             section=chunk.section,
             page=chunk.page,
-            excerpt=_summarize_excerpt(chunk.text),
+            excerpt=chunk.excerpt,
         )
         for chunk in top_chunks
     ]
-    return AskResponse(answer=answer, citations=citations)
-
-
-def _summarize_excerpt(text: str) -> str:
-    """Trim chunk excerpts to a manageable size for API responses."""
-    cleaned = " ".join(text.split())
-    if len(cleaned) <= 220:
-        return cleaned
-    return cleaned[:217] + "..."
+    response = AskResponse(answer=answer, citations=citations)
+    _answer_cache[cache_key] = response
+    while len(_answer_cache) > ANSWER_CACHE_SIZE:
+        _answer_cache.popitem(last=False)
+    return response
 
 
 @app.get("/health")
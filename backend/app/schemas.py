@@ -8,6 +8,11 @@ from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+def _normalize_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces; split() already drops leading/trailing blanks."""
+    return " ".join(text.split())
+
+
 class ScheduleItem(BaseModel):
     """Individual timetable entry surfaced in API responses."""
     time: str
@@ -56,10 +61,10 @@ class AskRequest(BaseModel):
     @classmethod
     def sanitize_question(cls, value: str) -> str:
         """Strip whitespace and collapse spaces before validation."""
-        text = (value or "").strip()
+        text = _normalize_whitespace(value or "")
         if not text:
             raise ValueError("Question cannot be empty.")
-        return " ".join(text.split())
+        return text
 
     @field_validator("context", mode="before")
     @classmethod
@@ -67,10 +72,7 @@ class AskRequest(BaseModel):
         """Normalize optional context strings, returning None for empty values."""
         if value is None:
             return None
-        text = value.strip()
-        if not text:
-            return None
-        return " ".join(text.split())
+        return _normalize_whitespace(value) or None
 
 
 class AskResponse(BaseModel):
@@ -9,7 +9,7 @@ from typing import Dict, List
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """Single vectorized passage extracted from an uploaded PDF."""
     id: str
@@ -18,6 +18,14 @@ class Chunk:
     section: str
     order: int
     embedding: np.ndarray
+    lower_text: str = field(init=False, repr=False)
+    excerpt: str = field(init=False, repr=False)
+    schedule_transitions: frozenset[str] = field(default_factory=frozenset, repr=False)
+
+    def __post_init__(self) -> None:
+        """Cache derived text views so per-request paths avoid recomputing them."""
+        self.lower_text = self.text.lower()
+        self.excerpt = _summarize_excerpt(self.text)
 
 
 @dataclass
@@ -35,7 +43,7 @@ class ScheduleDay:
     items: List[ScheduleItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentEntry:
     """Container for the uploaded PDF, its chunks, and extracted schedule."""
     id: str
@@ -44,17 +52,44 @@ class DocumentEntry:
     uploaded_at: datetime
     chunks: List[Chunk] = field(default_factory=list)
     schedule: List[ScheduleDay] = field(default_factory=list)
+    schedule_chunks: Dict[str, List[Chunk]] = field(default_factory=dict)
+    transition_notes: Dict[str, List[str]] = field(default_factory=dict)
+    embedding_codes: np.ndarray | None = field(default=None, repr=False)
+    embedding_scales: np.ndarray | None = field(default=None, repr=False)
+    page_indices: Dict[int, List[int]] = field(default_factory=dict, repr=False)
+
+    def build_embedding_matrix(self) -> np.ndarray:
+        """Quantize chunk embeddings into one int8 matrix shared with the chunks.
+
+        Rows use a symmetric per-row scale, so cosine similarity only needs the
+        int8 codes and the inverse norm of each code row. Chunk positions are
+        also indexed by page for neighbor expansion.
+        """
+        matrix = np.stack([chunk.embedding for chunk in self.chunks], dtype=np.float32)
+        absmax = np.abs(matrix).max(axis=1, keepdims=True)
+        codes = np.rint(matrix * (127.0 / np.where(absmax == 0, 1.0, absmax))).astype(np.int8)
+        norms = np.linalg.norm(codes.astype(np.float32), axis=1)
+        scales = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms != 0)
+        page_indices: Dict[int, List[int]] = {}
+        for index, chunk in enumerate(self.chunks):
+            chunk.embedding = codes[index]
+            page_indices.setdefault(chunk.page, []).append(index)
+        self.page_indices = page_indices
+        self.embedding_codes = codes
+        self.embedding_scales = scales
+        return codes
 
     def similarity_search(self, query_embedding: np.ndarray, top_k: int) -> List[Chunk]:
         """Compute cosine similarity and return the highest scoring chunks with neighbors."""
         if not self.chunks:
             return []
-        embeddings = np.vstack([chunk.embedding for chunk in self.chunks])
-        norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_embedding)
-        similarities = (
-            embeddings @ query_embedding
-        ) / np.where(norms == 0, 1e-10, norms)
-        anchor_indices = np.argsort(similarities)[::-1][:top_k]
+        codes = self.embedding_codes
+        if codes is None or len(codes) != len(self.chunks):
+            codes = self.build_embedding_matrix()
+        query_norm = np.linalg.norm(query_embedding)
+        query = np.asarray(query_embedding, dtype=np.float32) / (query_norm if query_norm else 1e-10)
+        similarities = (codes @ query) * self.embedding_scales
+        anchor_indices = _top_k_indices(similarities, top_k)
 
         selected: List[Chunk] = []
         seen_ids: set[str] = set()
@@ -66,9 +101,8 @@ class DocumentEntry:
             selected.append(anchor)
             seen_ids.add(anchor.id)
 
-            for candidate in self.chunks:
-                if candidate.page != anchor.page:
-                    continue
+            for candidate_index in self.page_indices[anchor.page]:
+                candidate = self.chunks[candidate_index]
                 if candidate.id in seen_ids:
                     continue
                 selected.append(candidate)
@@ -78,6 +112,26 @@ class DocumentEntry:
         return selected
 
 
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Return indices of the top_k scores in descending order without a full sort."""
+    count = min(top_k, len(scores))
+    if count <= 0:
+        return np.empty(0, dtype=np.intp)
+    if count < len(scores):
+        candidates = np.argpartition(-scores, count - 1)[:count]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates])]
+
+
+def _summarize_excerpt(text: str) -> str:
+    """Trim chunk excerpts to a manageable size for API responses."""
+    cleaned = " ".join(text.split())
+    if len(cleaned) <= 220:
+        return cleaned
+    return cleaned[:217] + "..."
+
+
 class DocumentRegistry:
     """In-memory store keyed by document id for quick lookups."""
     def __init__(self) -> None:
@@ -2,29 +2,159 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Iterable, List, Sequence
 
 import numpy as np
 from langchain_openai import OpenAIEmbeddings
+from openai import RateLimitError
 
 from backend.app.config import get_settings
 
+try:
+    import tiktoken  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+EMBED_BATCH_SIZE = 96
+EMBED_MAX_CONCURRENCY = 5
+EMBED_MAX_BATCH_TOKENS = 200_000
+QUERY_CACHE_SIZE = 1024
+
+_query_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_query_cache_lock = threading.Lock()
+
 
 def embed_chunks(texts: Iterable[str]) -> List[np.ndarray]:
     """Embed a collection of chunk texts and return numpy vectors."""
     settings = get_settings()
-    embeddings = OpenAIEmbeddings(
-        api_key=settings.openai_api_key,
-        model=settings.embedding_model,
-    ).embed_documents(list(texts))
+    embeddings = _get_embedder(settings.openai_api_key, settings.embedding_model).embed_documents(list(texts))
     return [np.array(vector, dtype="float32") for vector in embeddings]
 
 
+async def aembed_chunks(
+    texts: Iterable[str],
+    batch_size: int = EMBED_BATCH_SIZE,
+    max_concurrency: int = EMBED_MAX_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
+) -> List[np.ndarray]:
+    """Embed chunk texts in concurrent batches while preserving input order.
+
+    Pass a shared ``semaphore`` to bound concurrency across several calls.
+    """
+    items = list(texts)
+    if not items:
+        return []
+    settings = get_settings()
+    client = _get_embedder(settings.openai_api_key, settings.embedding_model)
+    batches = [
+        [items[index] for index in indices]
+        for indices in plan_embedding_batches(items, settings.embedding_model, batch_size)
+    ]
+    results: List[List[List[float]] | None] = [None] * len(batches)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(index: int, batch: Sequence[str]) -> None:
+        async with semaphore:
+            results[index] = await client.aembed_documents(list(batch))
+
+    outcomes = await asyncio.gather(
+        *(_run(index, batch) for index, batch in enumerate(batches)),
+        return_exceptions=True,
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException) and not isinstance(outcome, RateLimitError):
+            raise outcome
+    # Back off to one request at a time for batches that were rate limited.
+    for index, batch in enumerate(batches):
+        if results[index] is None:
+            results[index] = await client.aembed_documents(list(batch))
+
+    return [
+        np.array(vector, dtype="float32")
+        for batch_vectors in results
+        for vector in batch_vectors or []
+    ]
+
+
+@lru_cache(maxsize=4)
+def _get_embedder(api_key: str, model: str) -> OpenAIEmbeddings:
+    """Return a shared embeddings client so HTTP connections are pooled across calls."""
+    return OpenAIEmbeddings(api_key=api_key, model=model)
+
+
+def plan_embedding_batches(
+    texts: Sequence[str],
+    model: str,
+    max_items: int = EMBED_BATCH_SIZE,
+    max_tokens: int = EMBED_MAX_BATCH_TOKENS,
+) -> List[List[int]]:
+    """Greedily pack text indices into batches bounded by item count and token total."""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, tokens in enumerate(_count_tokens(texts, model)):
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _count_tokens(texts: Sequence[str], model: str) -> List[int]:
+    """Count tokens per text, estimating from length when no tokenizer is available."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return [len(text) // 4 + 1 for text in texts]
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(list(texts))]
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str) -> Any | None:
+    """Load the tiktoken encoding for a model, or None if it cannot be resolved."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
 def embed_query(text: str) -> np.ndarray:
-    """Embed a single query string for similarity search."""
+    """Embed a single query string for similarity search, reusing recent results."""
     settings = get_settings()
-    vector = OpenAIEmbeddings(
-        api_key=settings.openai_api_key,
-        model=settings.embedding_model,
-    ).embed_query(text)
-    return np.array(vector, dtype="float32")
+    normalized = " ".join(text.split())
+    key = hashlib.blake2b(
+        f"{settings.embedding_model}\n{normalized}".encode("utf-8"),
+        digest_size=16,
+    ).digest()
+    with _query_cache_lock:
+        cached = _query_cache.get(key)
+        if cached is not None:
+            _query_cache.move_to_end(key)
+            return cached
+    vector = np.array(
+        _get_embedder(settings.openai_api_key, settings.embedding_model).embed_query(text),
+        dtype="float32",
+    )
+    vector.flags.writeable = False
+    with _query_cache_lock:
+        _query_cache[key] = vector
+        while len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return vector
@@ -6,13 +6,24 @@ import io
 import re
 import uuid
 from dataclasses import dataclass
-from typing import List, Tuple
+from itertools import islice
+from typing import BinaryIO, Iterator, List, Tuple, Union
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from pypdf import PdfReader
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=800,
+    chunk_overlap=200,
+    add_start_index=True,
+)
 
-@dataclass
+# PDFs arrive either as cached bytes (demo guides) or as the spooled upload file.
+PdfSource = Union[bytes, BinaryIO]
+
+
+@dataclass(slots=True)
 class PageChunk:
     """Represents one chunk of text tied to a source page and section."""
     id: str
@@ -22,47 +33,62 @@ class PageChunk:
     order: int
 
 
-def load_pdf_chunks(file_bytes: bytes) -> Tuple[List[PageChunk], int]:
+def load_pdf_chunks(source: PdfSource) -> Tuple[List[PageChunk], int]:
     """Extract text from a PDF, split it into overlapping chunks, and return them with page count."""
-    reader = PdfReader(io.BytesIO(file_bytes))
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=800,
-        chunk_overlap=200,
-        add_start_index=True,
-    )
-    chunk_list: List[PageChunk] = []
+    reader = open_pdf(source)
+    return list(iter_pdf_chunks(reader)), len(reader.pages)
+
+
+def open_pdf(source: PdfSource) -> PdfReader:
+    """Open a PDF from bytes or a seekable stream without extracting any page text yet."""
+    return PdfReader(as_pdf_stream(source))
+
+
+def as_pdf_stream(source: PdfSource) -> BinaryIO:
+    """Wrap raw bytes in a stream, rewinding and passing through existing file objects."""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+def iter_pdf_chunks(reader: PdfReader) -> Iterator[PageChunk]:
+    """Yield overlapping chunks page by page so callers can start work before parsing ends."""
+    id_prefix = uuid.uuid4().hex
+    order = 0
     for page_index, page in enumerate(reader.pages, start=1):
         text = page.extract_text() or ""
         stripped = text.strip()
         if not stripped:
             continue
         section = infer_section_title(stripped)
-        for chunk_text in splitter.split_text(stripped):
-            chunk_list.append(
-                PageChunk(
-                    id=str(uuid.uuid4()),
-                    text=chunk_text,
-                    page=page_index,
-                    section=section,
-                    order=len(chunk_list),
-                )
+        for chunk_text in _SPLITTER.split_text(stripped):
+            yield PageChunk(
+                id=f"{id_prefix}-{order}",
+                text=chunk_text,
+                page=page_index,
+                section=section,
+                order=order,
             )
-    return chunk_list, len(reader.pages)
+            order += 1
 
 
 def infer_section_title(page_text: str) -> str:
     """Guess a section heading for a page by looking at prominent early lines."""
-    lines: List[str] = [line.strip() for line in page_text.splitlines() if line.strip()]
+    stripped_lines = (line.strip() for line in page_text.splitlines())
+    lines: List[str] = list(islice((line for line in stripped_lines if line), 5))
     if not lines:
         return "Unknown Section"
-    for line in lines[:5]:
-        alpha_ratio = sum(char.isalpha() for char in line) / max(len(line), 1)
-        if len(line) <= 80 and alpha_ratio > 0.5 and line.upper() == line:
+    for line in lines:
+        # Cheap length/case checks first; count letters only for heading candidates.
+        if len(line) > 80 or line.upper() != line:
+            continue
+        if sum(map(str.isalpha, line)) / len(line) > 0.5:
             return normalize_title(line)
     return normalize_title(lines[0])
 
 
 def normalize_title(title: str) -> str:
     """Collapse whitespace and title-case a heading-like string."""
-    cleaned = re.sub(r"\s+", " ", title).strip()
+    cleaned = _WHITESPACE_PATTERN.sub(" ", title).strip()
     return cleaned.title()
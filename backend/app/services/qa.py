@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Optional, Sequence
 
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 
 from backend.app.config import get_settings
@@ -58,12 +60,7 @@ def answer_question(
     context_text = "\n---\n".join(context_blocks)
 
     settings = get_settings()
-    llm = ChatOpenAI(
-        api_key=settings.openai_api_key,
-        model=settings.chat_model,
-        temperature=1,
-    )
-    chain = prompt | llm
+    chain = _get_chain(settings.openai_api_key, settings.chat_model)
     response = chain.invoke(
         {
             "context": context_text,
@@ -75,6 +72,17 @@ def answer_question(
     return response.content
 
 
+@lru_cache(maxsize=4)
+def _get_chain(api_key: str, model: str) -> Runnable:
+    """Return a shared prompt-plus-model chain so the chat client and its connections are reused."""
+    llm = ChatOpenAI(
+        api_key=api_key,
+        model=model,
+        temperature=1,
+    )
+    return prompt | llm
+
+
 def _build_schedule_context(schedule: Optional[Sequence[ScheduleDay]]) -> str | None:
     """Serialize the extracted schedule so it can be fed back into the prompt."""
     if not schedule:
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import io
 import re
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict, defaultdict
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
 
 from backend.app.services.document_registry import ScheduleDay, ScheduleItem
-from backend.app.services.pdf_loader import PageChunk
+from backend.app.services.pdf_loader import PageChunk, PdfSource, as_pdf_stream
 
 try:
     import pdfplumber  # type: ignore
@@ -35,6 +37,8 @@ _DAY_NAMES = [
     "Saturday",
     "Sunday",
 ]
+_DAY_NAMES_BY_UPPER = {day_name.upper(): day_name for day_name in _DAY_NAMES}
+_DAY_INITIALS = frozenset(day_name[0] for day_name in _DAY_NAMES)
 _MONTH_NAMES = {
     "JANUARY",
     "FEBRUARY",
@@ -95,6 +99,10 @@ _LOCATION_HINTS = {
     "square",
 }
 
+_LOCATION_SEPARATORS = (" at ", " - ", " \u2013 ", " \u2014 ", ":")
+# Leftmost match across all hints, i.e. the earliest position any hint occurs.
+_LOCATION_HINT_PATTERN = re.compile("|".join(map(re.escape, sorted(_LOCATION_HINTS))))
+
 _TIME_PATTERN = re.compile(
     r"^(?P<time>\d{1,2}:\d{2}(?:\s*[\u2013\u2014-]\s*\d{1,2}:\d{2})?(?:\s*(?:AM|PM))?)",
     re.IGNORECASE,
@@ -108,47 +116,68 @@ _TIME_TOKEN_PATTERN = re.compile(
     r"^(?:\d{1,2}:\d{2}(?:[\-\u2013\u2014]\d{1,2}:\d{2})?|[\-\u2013\u2014]|to)$",
     re.IGNORECASE,
 )
+# Non-digit characters that can start a time token: dashes and the "to" in "09:00 to 10:00".
+_TIME_TOKEN_LEAD_CHARS = frozenset("-\u2013\u2014tT")
+_TIME_WORD_PATTERN = re.compile(r"^\d{1,2}:\d{2}(?:[\-\u2013\u2014]\d{1,2}:\d{2})?$")
+_SIGNED_TIME_PATTERN = re.compile(r"^-?\d{1,2}:\d{2}$")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_DASH_PATTERN = re.compile(r"\s*[\u2013\u2014-]\s*")
+_ALPHANUMERIC_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_FOOTNOTE_SPLIT_PATTERN = re.compile(r"\s+\*\s+")
+# Footer site link and start-time notes; the leftmost hit removes everything after it.
+# Trailing numbers stay a separate pass because they can be exposed by this removal.
+_TRAILING_NOTE_PATTERN = re.compile(
+    r"\s*(?:\d+\s+t100triathlon\.com$|your wave start time.*$|start times will also be listed.*$)",
+    re.IGNORECASE,
+)
+_TRAILING_NUMBER_PATTERN = re.compile(r"\s+\d+$")
+_TRAILING_STARS_PATTERN = re.compile(r"\s*\*+$")
+_TRAILING_PAGE_NUMBER_PATTERN = re.compile(r"\s*\d{1,2}$")
+_TRAILING_LOCATION_PATTERN = re.compile(r"^(?P<activity>.+?)\s+(?P<location>[A-Z][A-Za-z0-9\s()'&\-/.,]+)$")
+_SCHEDULE_HEADING_TAIL_PATTERN = re.compile(r"(EVENT|PRO|RACE)\s+SCHEDULE.*$", re.IGNORECASE)
+_CAMEL_CASE_BOUNDARY_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])")
 
 
 
 
-def extract_schedule(file_bytes: bytes, chunks: Sequence[PageChunk]) -> List[ScheduleDay]:
+def extract_schedule(source: PdfSource, chunks: Sequence[PageChunk]) -> List[ScheduleDay]:
     """High-level entrypoint that prefers layout parsing and falls back to text."""
-    pages = sorted({chunk.page for chunk in chunks if _looks_like_schedule_section(chunk.section)})
-    if not pages:
+    schedule_chunks = [chunk for chunk in chunks if _looks_like_schedule_section(chunk.section)]
+    if not schedule_chunks:
         return []
+    pages = sorted({chunk.page for chunk in schedule_chunks})
 
     schedule: List[ScheduleDay] = []
 
     if pdfplumber is not None:
-        layout_schedule = _extract_with_layout(file_bytes, pages)
+        layout_schedule = _extract_with_layout(source, pages)
         if layout_schedule:
             schedule = layout_schedule
 
     if not schedule:
-        schedule = _extract_from_text(chunks)
+        schedule = _extract_from_text(schedule_chunks)
 
     return schedule
 
 
-def _extract_with_layout(file_bytes: bytes, pages: Sequence[int]) -> List[ScheduleDay]:
+def _extract_with_layout(source: PdfSource, pages: Sequence[int]) -> List[ScheduleDay]:
     """Use pdfplumber layout metadata to recover day-by-day schedule tables."""
     try:
-        pdf = pdfplumber.open(io.BytesIO(file_bytes))
+        # Only the schedule pages are materialized; out-of-range numbers are skipped.
+        pdf = pdfplumber.open(as_pdf_stream(source), pages=list(pages))
     except Exception:
         return []
 
-    try:
+    with pdf:
         collected: OrderedDict[str, ScheduleDay] = OrderedDict()
-        for page_number in pages:
-            if page_number - 1 < 0 or page_number - 1 >= len(pdf.pages):
-                continue
-            page = pdf.pages[page_number - 1]
+        seen_by_title: dict[str, set[Tuple[str, str, str]]] = {}
+        for page in pdf.pages:
             days = _parse_schedule_page(page)
+            page.close()
             for day in days:
                 existing = collected.get(day.title)
                 if existing:
-                    seen = {(item.time, item.activity, item.location or "") for item in existing.items}
+                    seen = seen_by_title[day.title]
                     for item in day.items:
                         key = (item.time, item.activity, item.location or "")
                         if key not in seen:
@@ -156,9 +185,10 @@ def _extract_with_layout(file_bytes: bytes, pages: Sequence[int]) -> List[Schedu
                             seen.add(key)
                 else:
                     collected[day.title] = day
+                    seen_by_title[day.title] = {
+                        (item.time, item.activity, item.location or "") for item in day.items
+                    }
         return list(collected.values())
-    finally:
-        pdf.close()
 
 
 def _parse_schedule_page(page: "pdfplumber.page.Page") -> List[ScheduleDay]:  # type: ignore[name-defined]
@@ -167,15 +197,16 @@ def _parse_schedule_page(page: "pdfplumber.page.Page") -> List[ScheduleDay]:  #
     if not words:
         return []
 
-    lines = _group_words_by_line(words)
-    day_rows = _detect_day_rows(lines)
-    if not day_rows:
+    line_tops, line_words = _group_words_by_line(words)
+    titles, day_tops = _detect_day_rows(line_tops, line_words)
+    if not titles:
         return []
 
     schedule: List[ScheduleDay] = []
-    for index, (title, start_top) in enumerate(day_rows):
-        end_top = day_rows[index + 1][1] if index + 1 < len(day_rows) else float("inf")
-        items = _collect_items_for_range(lines, start_top, end_top)
+    for index, title in enumerate(titles):
+        start_top = day_tops[index]
+        end_top = day_tops[index + 1] if index + 1 < len(day_tops) else float("inf")
+        items = _collect_items_for_range(line_tops, line_words, start_top, end_top)
         if not items:
             continue
         day = ScheduleDay(title=title)
@@ -184,27 +215,34 @@ def _parse_schedule_page(page: "pdfplumber.page.Page") -> List[ScheduleDay]:  #
     return schedule
 
 
-def _group_words_by_line(words: Sequence[dict]) -> List[Tuple[float, List[dict]]]:
-    """Cluster words that share a similar baseline to approximate lines."""
-    grouped: defaultdict[float, List[dict]] = defaultdict(list)
+def _group_words_by_line(words: Sequence[dict]) -> Tuple[List[float], List[List[dict]]]:
+    """Cluster words that share a similar baseline to approximate lines.
+
+    Returns parallel lists of line tops (ascending) and each line's words.
+    """
+    grouped: defaultdict[float, List[Tuple[float, float, dict]]] = defaultdict(list)
     for word in words:
-        key = round(float(word["top"]), 1)
-        grouped[key].append(word)
+        top = float(word["top"])
+        grouped[round(top, 1)].append((float(word["x0"]), top, word))
     lines: List[Tuple[float, List[dict]]] = []
-    for key, items in grouped.items():
-        line_top = min(float(item["top"]) for item in items)
-        sorted_items = sorted(items, key=lambda item: float(item["x0"]))
-        lines.append((line_top, sorted_items))
-    lines.sort(key=lambda entry: entry[0])
-    return lines
-
-
-def _detect_day_rows(lines: Sequence[Tuple[float, List[dict]]]) -> List[Tuple[str, float]]:
-    """Identify lines that look like day headings to split the schedule."""
-    day_rows: List[Tuple[str, float]] = []
+    for items in grouped.values():
+        line_top = min(item[1] for item in items)
+        items.sort(key=itemgetter(0))
+        lines.append((line_top, [item[2] for item in items]))
+    lines.sort(key=itemgetter(0))
+    return [line[0] for line in lines], [line[1] for line in lines]
+
+
+def _detect_day_rows(
+    line_tops: Sequence[float],
+    line_words: Sequence[List[dict]],
+) -> Tuple[List[str], List[float]]:
+    """Identify lines that look like day headings, returning parallel titles and tops."""
+    titles: List[str] = []
+    day_tops: List[float] = []
     seen_titles: set[str] = set()
-    for top, words in lines:
-        text = " ".join(word["text"] for word in words).strip()
+    for top, words in zip(line_tops, line_words):
+        text = " ".join([word["text"] for word in words]).strip()
         match = _DAY_LINE_PATTERN.match(text)
         if not match:
             continue
@@ -214,22 +252,25 @@ def _detect_day_rows(lines: Sequence[Tuple[float, List[dict]]]) -> List[Tuple[st
         if not normalized or normalized in seen_titles:
             continue
         seen_titles.add(normalized)
-        day_rows.append((normalized, top))
-    return day_rows
+        titles.append(normalized)
+        day_tops.append(top)
+    return titles, day_tops
 
 
 def _collect_items_for_range(
-    lines: Sequence[Tuple[float, List[dict]]],
+    line_tops: Sequence[float],
+    line_words: Sequence[List[dict]],
     start_top: float,
     end_top: float,
 ) -> List[ScheduleItem]:
     """Gather schedule items that fall between two vertical positions."""
-    entries = _build_day_entries(lines, start_top, end_top)
+    entries = _build_day_entries(line_tops, line_words, start_top, end_top)
     if not entries:
         return []
     items: List[ScheduleItem] = []
     seen: set[Tuple[str, str, str]] = set()
     used_indices: set[int] = set()
+    tops = [entry.top for entry in entries]
 
     for idx, entry in enumerate(entries):
         if idx in used_indices:
@@ -240,17 +281,17 @@ def _collect_items_for_range(
         used_indices.update(group_indices)
         group_entries = [entries[i] for i in group_indices]
         time_text = _normalize_time_tokens([item.text for item in group_entries])
-        activity_entries, location_entries, desc_indices = _collect_description(entries, group_entries, used_indices)
+        activity_entries, location_entries, desc_indices = _collect_description(entries, tops, group_entries, used_indices)
         if not activity_entries:
             continue
         used_indices.update(desc_indices)
-        raw_activity_text = " ".join(item.text for item in activity_entries)
+        raw_activity_text = " ".join([item.text for item in activity_entries])
         activity = _clean_activity_text(raw_activity_text)
         if not activity:
             continue
         location_text = None
         if location_entries:
-            raw_location_text = " ".join(item.text for item in location_entries)
+            raw_location_text = " ".join([item.text for item in location_entries])
             location_text = _clean_location_text(raw_location_text)
         if not location_text:
             activity, inferred_location = _split_activity_and_location_text(activity)
@@ -266,16 +307,15 @@ def _collect_items_for_range(
 
 
 def _build_day_entries(
-    lines: Sequence[Tuple[float, List[dict]]],
+    line_tops: Sequence[float],
+    line_words: Sequence[List[dict]],
     start_top: float,
     end_top: float,
 ) -> List["_Entry"]:
-    """Convert raw word groups into normalized schedule entries."""
+    """Convert raw word groups strictly between two tops into normalized schedule entries."""
     words: List[dict] = []
-    for top, line_words in lines:
-        if top <= start_top or top >= end_top:
-            continue
-        words.extend(line_words)
+    for words_in_line in line_words[bisect_right(line_tops, start_top) : bisect_left(line_tops, end_top)]:
+        words.extend(words_in_line)
     if not words:
         return []
     sorted_words = sorted(words, key=lambda word: (float(word["top"]), float(word["x0"])))
@@ -285,32 +325,23 @@ def _build_day_entries(
         text = str(word.get("text", "")).strip()
         if not text:
             continue
-        entries.append(
-            _Entry(
-                index=counter,
-                text=text,
-                top=float(word["top"]),
-                x0=float(word["x0"]),
-                x1=float(word["x1"]),
-            )
-        )
+        entries.append(_Entry(counter, text, float(word["top"]), float(word["x0"]), float(word["x1"])))
         counter += 1
     return entries
 
 
-class _Entry:
-
-    def __init__(self, index: int, text: str, top: float, x0: float, x1: float) -> None:
-        self.index = index
-        self.text = text
-        self.top = top
-        self.x0 = x0
-        self.x1 = x1
+class _Entry(NamedTuple):
+    """Positioned word on a schedule page, ordered top-to-bottom then left-to-right."""
+    index: int
+    text: str
+    top: float
+    x0: float
+    x1: float
 
 
 def _looks_like_time_word(text: str) -> bool:
     """Check if a token resembles a time or time range."""
-    return bool(re.match(r"^\d{1,2}:\d{2}(?:[\-\u2013\u2014]\d{1,2}:\d{2})?$", text))
+    return text[:1].isdigit() and bool(_TIME_WORD_PATTERN.match(text))
 
 
 def _expand_time_group(entries: Sequence[_Entry], start_index: int) -> List[int]:
@@ -331,10 +362,15 @@ def _expand_time_group(entries: Sequence[_Entry], start_index: int) -> List[int]
 
 def _collect_description(
     entries: Sequence[_Entry],
+    tops: Sequence[float],
     time_group: Sequence[_Entry],
     used_indices: set[int],
 ) -> Tuple[List[_Entry], List[_Entry], List[int]]:
-    """Build a description string from the remaining tokens in a line."""
+    """Build a description string from the remaining tokens in a line.
+
+    ``tops`` mirrors ``entries``, which are sorted by top, so the vertical
+    window is found by bisection instead of scanning every entry.
+    """
     time_top = sum(item.top for item in time_group) / len(time_group)
     min_top = time_top - 12
     max_top = time_top + 16
@@ -342,11 +378,9 @@ def _collect_description(
 
     collected: List[_Entry] = []
     collected_indices: List[int] = []
-    for entry in entries:
+    for entry in entries[bisect_left(tops, min_top) : bisect_right(tops, max_top)]:
         if entry.index in used_indices:
             continue
-        if entry.top < min_top or entry.top > max_top:
-            continue
         if entry.x0 < min_x:
             continue
         collected.append(entry)
@@ -395,15 +429,13 @@ def _split_entries_by_column(entries: Sequence[_Entry]) -> Tuple[List[_Entry], L
 
 def _clean_activity_text(value: str) -> str:
     """Normalize schedule activity text by trimming artifacts."""
-    cleaned = re.sub(r"\s+", " ", value).strip()
+    cleaned = _WHITESPACE_PATTERN.sub(" ", value).strip()
     if not cleaned:
         return ""
     # remove trailing footnotes or page artefacts
-    cleaned = re.split(r"\s+\*\s+", cleaned)[0]
-    cleaned = re.sub(r"\s*\d+\s+t100triathlon\.com$", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*your wave start time.*$", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*start times will also be listed.*$", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s+\d+$", "", cleaned)
+    cleaned = _FOOTNOTE_SPLIT_PATTERN.split(cleaned)[0]
+    cleaned = _TRAILING_NOTE_PATTERN.sub("", cleaned)
+    cleaned = _TRAILING_NUMBER_PATTERN.sub("", cleaned)
     cleaned = cleaned.strip(" -")
     return cleaned.strip()
 
@@ -412,10 +444,10 @@ def _clean_activity_text(value: str) -> str:
 
 def _clean_location_text(value: str) -> str | None:
     """Normalize optional location text and filter noise."""
-    cleaned = re.sub(r"\s+", " ", value).strip()
+    cleaned = _WHITESPACE_PATTERN.sub(" ", value).strip()
     cleaned = cleaned.strip("-,:")
-    cleaned = re.sub(r"\s*\*+$", "", cleaned)
-    cleaned = re.sub(r"\s*\d{1,2}$", "", cleaned)
+    cleaned = _TRAILING_STARS_PATTERN.sub("", cleaned)
+    cleaned = _TRAILING_PAGE_NUMBER_PATTERN.sub("", cleaned)
     cleaned = cleaned.strip()
     if not cleaned:
         return None
@@ -445,56 +477,28 @@ def _split_activity_and_location_text(value: str) -> Tuple[str, str | None]:
     if not text:
         return "", None
 
-    candidates: list[tuple[str, str]] = []
-    lowered = text.lower()
-
-    idx = lowered.rfind(" at ")
-    if idx != -1:
-        left = text[:idx].strip(" -,:")
-        right = text[idx + 4 :].strip(" -,:")
-        if _looks_like_location_text(right):
-            candidates.append((left, right))
-
-    dash_variants = [" - ", f" {chr(8211)} ", f" {chr(8212)} "]
-    for sep in dash_variants:
-        idx = text.rfind(sep)
-        if idx != -1:
-            left = text[:idx].strip(" -,:")
-            right = text[idx + len(sep) :].strip(" -,:")
-            if _looks_like_location_text(right):
-                candidates.append((left, right))
-
-    idx = text.rfind(":")
-    if idx != -1:
-        left = text[:idx].strip()
-        right = text[idx + 1 :].strip(" -,:")
-        if _looks_like_location_text(right):
-            candidates.append((left, right))
-
-    for left, right in candidates:
+    # Separators are tried in priority order; the first usable split wins.
+    for separator in _LOCATION_SEPARATORS:
+        haystack = text.lower() if separator == " at " else text
+        idx = haystack.rfind(separator)
+        if idx == -1:
+            continue
+        left = text[:idx].strip() if separator == ":" else text[:idx].strip(" -,:")
+        right = text[idx + len(separator) :].strip(" -,:")
+        if not _looks_like_location_text(right):
+            continue
         cleaned_left = left.strip()
-        cleaned_right = right.strip()
-        if cleaned_left and cleaned_right:
-            return cleaned_left, cleaned_right
-
-    match = re.search(
-        r"^(?P<activity>.+?)\s+(?P<location>[A-Z][A-Za-z0-9\s()'&\-/.,]+)$",
-        text,
-    )
+        if cleaned_left:
+            return cleaned_left, right.strip()
+
+    match = _TRAILING_LOCATION_PATTERN.search(text)
     if match:
         activity_part = match.group("activity").strip()
         location_part = match.group("location").strip("-,: ")
         if activity_part and location_part:
-            lowered_location = location_part.lower()
-            hint_positions = [
-                (lowered_location.find(hint), hint)
-                for hint in _LOCATION_HINTS
-                if hint in lowered_location
-            ]
-            hint_positions = [item for item in hint_positions if item[0] != -1]
-            if hint_positions:
-                hint_positions.sort(key=lambda item: item[0])
-                first_index, _ = hint_positions[0]
+            hint_match = _LOCATION_HINT_PATTERN.search(location_part.lower())
+            if hint_match:
+                first_index = hint_match.start()
                 prefix_segment = location_part[:first_index].rstrip()
                 suffix_segment = location_part[first_index:].strip()
                 if prefix_segment:
@@ -513,9 +517,9 @@ def _split_activity_and_location_text(value: str) -> Tuple[str, str | None]:
 
 def _extract_from_text(chunks: Sequence[PageChunk]) -> List[ScheduleDay]:
     """Fallback parser that operates on plain text chunks when layout fails."""
-    sections: OrderedDict[str, List[Tuple[str, str, str | None]]] = OrderedDict()
+    sections: OrderedDict[str, ScheduleDay] = OrderedDict()
     seen: set[Tuple[str, str, str, str]] = set()
-    current_title: str | None = None
+    current_day: ScheduleDay | None = None
 
     for chunk in chunks:
         if not _looks_like_schedule_section(chunk.section):
@@ -529,11 +533,12 @@ def _extract_from_text(chunks: Sequence[PageChunk]) -> List[ScheduleDay]:
                 continue
             day_label = _parse_day_label(line)
             if day_label:
-                current_title = day_label
-                sections.setdefault(day_label, [])
+                current_day = sections.get(day_label)
+                if current_day is None:
+                    current_day = sections[day_label] = ScheduleDay(title=day_label)
                 continue
             parsed = _parse_time_and_activity(line)
-            if not parsed or current_title is None:
+            if not parsed or current_day is None:
                 continue
             time_value, activity_raw = parsed
             activity_text = _clean_activity_text(activity_raw)
@@ -542,7 +547,7 @@ def _extract_from_text(chunks: Sequence[PageChunk]) -> List[ScheduleDay]:
             activity_text, inferred_location = _split_activity_and_location_text(activity_text)
             location_text = _clean_location_text(inferred_location) if inferred_location else None
             key = (
-                current_title.lower(),
+                current_day.title.lower(),
                 time_value,
                 activity_text.lower(),
                 (location_text or "").lower(),
@@ -550,33 +555,30 @@ def _extract_from_text(chunks: Sequence[PageChunk]) -> List[ScheduleDay]:
             if key in seen:
                 continue
             seen.add(key)
-            sections.setdefault(current_title, []).append((time_value, activity_text, location_text))
+            current_day.items.append(ScheduleItem(time=time_value, activity=activity_text, location=location_text))
 
-    schedule: List[ScheduleDay] = []
-    for title, entries in sections.items():
-        if not entries:
-            continue
-        day = ScheduleDay(title=title)
-        for time_value, activity, location in entries:
-            day.items.append(ScheduleItem(time=time_value, activity=activity, location=location))
-        schedule.append(day)
-    return schedule
+    return [day for day in sections.values() if day.items]
 
 
+@lru_cache(maxsize=1024)
 def _looks_like_schedule_section(section_title: str) -> bool:
     """Check whether a section title likely represents a timetable."""
     if not section_title:
         return False
     lowered = section_title.lower()
-    squashed = lowered.replace(" ", "")
-    if any(phrase in lowered or phrase in squashed for phrase in _BLOCKLISTED_SECTION_PHRASES):
+    if any(phrase in lowered for phrase in _BLOCKLISTED_SECTION_PHRASES):
         return False
+    # Letter-spaced headings ("L O C A T I O N") only match once spaces are removed.
+    if " " in lowered:
+        squashed = lowered.replace(" ", "")
+        if any(phrase in squashed for phrase in _BLOCKLISTED_SECTION_PHRASES):
+            return False
     return any(keyword in lowered for keyword in _SCHEDULE_SECTION_KEYWORDS)
 
 
 def _should_skip_line(line: str) -> bool:
     """Filter out decorative or irrelevant lines before parsing."""
-    cleaned = re.sub(r"\s+", " ", line).strip()
+    cleaned = _WHITESPACE_PATTERN.sub(" ", line).strip()
     if not cleaned:
         return True
     if cleaned.startswith("*"):
@@ -594,18 +596,18 @@ def _should_skip_line(line: str) -> bool:
 
 def _parse_day_label(line: str) -> str | None:
     """Attempt to build a normalized day label from a text line."""
-    tokens = re.findall(r"[A-Za-z0-9]+", line)
-    if not tokens:
+    tokens = _ALPHANUMERIC_PATTERN.findall(line)
+    if not tokens or tokens[0][0].upper() not in _DAY_INITIALS:
         return None
-    upper_tokens = [token.upper() for token in tokens]
+    upper_tokens = [token.upper() for token in tokens[:3]]
     for index in range(1, min(len(tokens), 4)):
-        candidate = "".join(upper_tokens[:index])
-        for day_name in _DAY_NAMES:
-            if candidate == day_name.upper():
-                remainder = tokens[index:]
-                result = _assemble_day_label(day_name, remainder)
-                if result:
-                    return result
+        # Multi-token prefixes cover headings split by punctuation, e.g. "SATUR-DAY".
+        candidate = upper_tokens[0] if index == 1 else "".join(upper_tokens[:index])
+        day_name = _DAY_NAMES_BY_UPPER.get(candidate)
+        if day_name is not None:
+            result = _assemble_day_label(day_name, tokens[index:])
+            if result:
+                return result
     return None
 
 
@@ -635,42 +637,45 @@ def _parse_time_and_activity(line: str) -> Tuple[str, str] | None:
     if not match:
         return None
     time_value_raw = match.group("time")
-    time_value = re.sub(r"\s*[\u2013\u2014-]\s*", " - ", time_value_raw).upper()
+    time_value = _DASH_PATTERN.sub(" - ", time_value_raw).upper()
     remainder = line[match.end():].strip().strip("-\u2013\u2014")
     if not remainder:
         return None
     remainder = remainder.replace("**", "").replace("*", "").strip()
-    remainder = re.sub(r"(EVENT|PRO|RACE)\s+SCHEDULE.*$", "", remainder, flags=re.IGNORECASE)
-    remainder = re.sub(r"\s+", " ", remainder).strip()
+    remainder = _SCHEDULE_HEADING_TAIL_PATTERN.sub("", remainder)
+    remainder = _WHITESPACE_PATTERN.sub(" ", remainder).strip()
     if not remainder:
         return None
     if _parse_day_label(remainder):
         return None
-    remainder = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", remainder)
+    remainder = _CAMEL_CASE_BOUNDARY_PATTERN.sub(" ", remainder)
     return time_value, remainder
 
 
 def _normalize_title(value: str) -> str:
     """Title-case and compress whitespace in headings."""
-    cleaned = re.sub(r"\s+", " ", value).strip()
+    cleaned = _WHITESPACE_PATTERN.sub(" ", value).strip()
     return cleaned.title()
 
 
 def _is_time_token(token: str) -> bool:
     """Return True when a token resembles part of a time expression."""
     stripped = token.strip()
-    return bool(_TIME_TOKEN_PATTERN.match(stripped) or re.match(r"^-?\d{1,2}:\d{2}$", stripped))
+    first = stripped[:1]
+    if not first.isdigit() and first not in _TIME_TOKEN_LEAD_CHARS:
+        return False
+    return bool(_TIME_TOKEN_PATTERN.match(stripped) or _SIGNED_TIME_PATTERN.match(stripped))
 
 
 def _normalize_time_tokens(tokens: Sequence[str]) -> str:
     """Join discrete time tokens into a canonical representation."""
     joined = " ".join(tokens)
-    joined = re.sub(r"\s*[\u2013\u2014-]\s*", " - ", joined)
-    joined = re.sub(r"\s+", " ", joined)
+    joined = _DASH_PATTERN.sub(" - ", joined)
+    joined = _WHITESPACE_PATTERN.sub(" ", joined)
     return joined.strip().upper()
 
 
 def _normalize_description(tokens: Sequence[str]) -> str:
     """Clean up extraneous whitespace from description tokens."""
     text = " ".join(tokens)
-    return re.sub(r"\s+", " ", text).strip()
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
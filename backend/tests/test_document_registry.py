@@ -0,0 +1,49 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import numpy as np
+
+from backend.app.services.document_registry import Chunk, DocumentEntry
+
+
+def _entry(vectors, pages):
+    entry = DocumentEntry(id="doc-1", filename="guide.pdf", page_count=max(pages), uploaded_at=datetime.now())
+    for index, (vector, page) in enumerate(zip(vectors, pages)):
+        entry.chunks.append(
+            Chunk(
+                id=f"chunk-{index}",
+                text=f"chunk {index}",
+                page=page,
+                section="Section",
+                order=index,
+                embedding=np.array(vector, dtype="float32"),
+            )
+        )
+    return entry
+
+
+def test_similarity_search_ranks_by_cosine_and_adds_page_neighbor() -> None:
+    entry = _entry(
+        vectors=[[1.0, 0.0], [0.0, 5.0], [3.0, 3.1], [0.0, 0.0]],
+        pages=[1, 2, 2, 3],
+    )
+
+    results = entry.similarity_search(np.array([0.0, 2.0], dtype="float32"), top_k=2)
+
+    assert [chunk.id for chunk in results] == ["chunk-1", "chunk-2"]
+
+
+def test_similarity_search_pulls_first_unseen_chunk_from_anchor_page() -> None:
+    entry = _entry(
+        vectors=[[0.0, 1.0], [1.0, 0.0], [0.9, 0.1]],
+        pages=[1, 1, 2],
+    )
+
+    results = entry.similarity_search(np.array([1.0, 0.0], dtype="float32"), top_k=1)
+
+    assert [chunk.id for chunk in results] == ["chunk-1", "chunk-0"]
@@ -0,0 +1,59 @@
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.app.services import embedding
+
+
+class _FakeEmbeddings:
+    def __init__(self, **_: object) -> None:
+        pass
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(0.01 * (len(texts) % 3))
+        return [[float(text)] for text in texts]
+
+
+def test_aembed_chunks_preserves_order(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(embedding, "OpenAIEmbeddings", _FakeEmbeddings)
+    monkeypatch.setattr(embedding, "_get_embedder", embedding._get_embedder.__wrapped__)
+    monkeypatch.setattr(embedding, "_get_encoding", lambda model: None)
+    texts = [str(index) for index in range(10)]
+
+    vectors = asyncio.run(embedding.aembed_chunks(texts, batch_size=3, max_concurrency=2))
+
+    assert [float(vector[0]) for vector in vectors] == list(range(10))
+
+
+def test_plan_embedding_batches_respects_item_and_token_limits(monkeypatch) -> None:
+    monkeypatch.setattr(embedding, "_get_encoding", lambda model: None)
+    texts = ["x" * 39] * 5 + ["y" * 399] + ["z" * 3]
+
+    batches = embedding.plan_embedding_batches(texts, "test-model", max_items=3, max_tokens=100)
+
+    assert batches == [[0, 1, 2], [3, 4], [5], [6]]
+
+
+def test_embed_query_reuses_cached_vector_for_equivalent_text(monkeypatch) -> None:
+    calls = []
+
+    class _CountingEmbeddings(_FakeEmbeddings):
+        def embed_query(self, text: str) -> list[float]:
+            calls.append(text)
+            return [1.0, 2.0]
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(embedding, "OpenAIEmbeddings", _CountingEmbeddings)
+    monkeypatch.setattr(embedding, "_get_embedder", embedding._get_embedder.__wrapped__)
+    monkeypatch.setattr(embedding, "_query_cache", embedding.OrderedDict())
+
+    first = embedding.embed_query("When does  transition open?")
+    second = embedding.embed_query("When does transition open? ")
+
+    assert calls == ["When does  transition open?"]
+    assert second is first
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from collections import OrderedDict
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend.app import main
+from backend.app.main import app
+
+
+def test_examples_lists_bundled_guides() -> None:
+    with TestClient(app) as client:
+        response = client.get("/examples")
+
+    assert response.status_code == 200
+    slugs = [guide["slug"] for guide in response.json()]
+    assert "london-t100-2025-athlete-guide" in slugs
+    assert slugs == sorted(slugs)
+
+
+def test_load_example_rejects_unknown_slug() -> None:
+    with TestClient(app) as client:
+        response = client.post("/examples/not-a-guide")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Example guide not found."}
+
+
+def test_load_example_reuses_prepared_guide(monkeypatch) -> None:
+    calls = []
+
+    async def _counting_aembed_chunks(texts, **_):
+        calls.append(len(texts))
+        return [np.ones(4, dtype="float32") for _ in texts]
+
+    monkeypatch.setattr(main, "aembed_chunks", _counting_aembed_chunks)
+    monkeypatch.setattr(main, "_prepared_examples", OrderedDict())
+
+    with TestClient(app) as client:
+        first = client.post("/examples/london-t100-2025-athlete-guide")
+        embed_calls = len(calls)
+        second = client.post("/examples/london-t100-2025-athlete-guide")
+
+    assert first.status_code == second.status_code == 200
+    assert embed_calls > 0
+    assert len(calls) == embed_calls
+    assert first.json()["document_id"] != second.json()["document_id"]
+    assert first.json()["schedule"] == second.json()["schedule"]
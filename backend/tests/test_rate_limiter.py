@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend.app import main
+from backend.app.main import RateLimiter
+
+
+def test_rate_limiter_allows_burst_then_refills(monkeypatch) -> None:
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(main.time, "monotonic", lambda: clock["now"])
+    limiter = RateLimiter(limit=2, window_seconds=60)
+
+    assert limiter.check("client")
+    assert limiter.check("client")
+    assert not limiter.check("client")
+    assert limiter.check("other")
+
+    clock["now"] += 15
+    assert not limiter.check("client")
+
+    clock["now"] += 15
+    assert limiter.check("client")
+    assert not limiter.check("client")
+
+    clock["now"] += 60
+    assert limiter.check("client")
+    assert limiter.check("client")
+    assert not limiter.check("client")
+
+
+def test_rate_limiter_evicts_least_recent_keys(monkeypatch) -> None:
+    monkeypatch.setattr(RateLimiter, "MAX_TRACKED_KEYS", 2)
+    limiter = RateLimiter(limit=1, window_seconds=60)
+
+    assert limiter.check("a")
+    assert limiter.check("b")
+    assert limiter.check("c")
+
+    assert limiter.check("a")
+    assert not limiter.check("c")
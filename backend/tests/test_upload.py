@@ -31,3 +31,18 @@ def test_upload_rejects_missing_filename() -> None:
 
     assert response.status_code == 400
     assert response.json() == {"detail": "Filename is required."}
+
+
+def test_upload_rejects_oversized_pdf(monkeypatch) -> None:
+    from backend.app import main
+
+    monkeypatch.setattr(main, "MAX_PDF_SIZE_BYTES", 1024)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/upload",
+            files={"file": ("guide.pdf", b"%PDF-1.4\n" + b"0" * 4096, "application/pdf")},
+        )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "PDF exceeds 80 MB limit."}